@@ -1 +1,4 @@
-# Empty init file for Django project package
+# Django project package; load the Celery app so @shared_task binds to it
+from .celery import app as celery_app
+
+__all__ = ("celery_app",)
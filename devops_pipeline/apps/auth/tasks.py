@@ -0,0 +1,16 @@
+"""Auth background tasks."""
+
+from celery import shared_task
+
+from .models import UserSession
+
+
+@shared_task
+def record_user_session(user_id, session_key, ip_address, user_agent):
+    """Persist a UserSession row for security monitoring."""
+    UserSession.objects.create(
+        user_id=user_id,
+        session_key=session_key,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
@@ -1,14 +1,19 @@
 """Auth views."""
 
+from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.core.cache import cache
 from django.shortcuts import redirect, render
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 import json
 
+from devops_pipeline.http import FastJsonResponse
+
 from .models import UserSession
+from .tasks import record_user_session
 
 
 def login_view(request):
@@ -21,20 +26,28 @@ def login_view(request):
         if user is not None:
             login(request, user)
             
-            # Track session for security monitoring
-            UserSession.objects.create(
-                user=user,
-                session_key=request.session.session_key,
-                ip_address=get_client_ip(request),
-                user_agent=request.META.get('HTTP_USER_AGENT', '')
+            # Track session for security monitoring (off the request path)
+            record_user_session.delay(
+                user.id,
+                request.session.session_key,
+                get_client_ip(request),
+                request.META.get('HTTP_USER_AGENT', '')
+            )
+            cache.set(
+                session_cache_key(request.session.session_key),
+                {'user_id': user.id, 'last_activity': timezone.now()},
+                settings.SESSION_COOKIE_AGE
             )
             
             if request.headers.get('Accept') == 'application/json':
-                return JsonResponse({'status': 'success', 'user': user.username})
+                return FastJsonResponse({'status': 'success', 'user': user.username})
             return redirect('catalog:product_list')
         else:
             if request.headers.get('Accept') == 'application/json':
-                return JsonResponse({'status': 'error', 'message': 'Invalid credentials'}, status=401)
+                return FastJsonResponse(
+                    {'status': 'error', 'message': 'Invalid credentials'},
+                    status=401
+                )
             return render(request, 'registration/login.html', {'error': 'Invalid credentials'})
     
     return render(request, 'registration/login.html')
@@ -43,17 +56,13 @@ def login_view(request):
 @login_required
 def logout_view(request):
     """Enhanced logout view with session cleanup."""
-    # Mark session as inactive
-    try:
-        session = UserSession.objects.get(
-            user=request.user,
-            session_key=request.session.session_key,
-            is_active=True
-        )
-        session.is_active = False
-        session.save()
-    except UserSession.DoesNotExist:
-        pass
+    # Mark session as inactive (single UPDATE, no-op if nothing matches)
+    UserSession.objects.filter(
+        user=request.user,
+        session_key=request.session.session_key,
+        is_active=True
+    ).update(is_active=False)
+    cache.delete(session_cache_key(request.session.session_key))
     
     logout(request)
     return redirect('catalog:product_list')
@@ -64,21 +73,35 @@ def logout_view(request):
 def check_session(request):
     """API endpoint to check session validity."""
     if not request.user.is_authenticated:
-        return JsonResponse({'valid': False}, status=401)
+        return FastJsonResponse({'valid': False}, status=401)
+    
+    key = session_cache_key(request.session.session_key)
+    data = cache.get(key)
+    if data is None:
+        # Cache miss: fall back to the database and repopulate
+        try:
+            session = UserSession.objects.get(
+                user=request.user,
+                session_key=request.session.session_key,
+                is_active=True
+            )
+        except UserSession.DoesNotExist:
+            return FastJsonResponse({'valid': False}, status=401)
+        data = {'user_id': session.user_id, 'last_activity': session.last_activity}
+        cache.set(key, data, settings.SESSION_COOKIE_AGE)
+    elif data['user_id'] != request.user.id:
+        return FastJsonResponse({'valid': False}, status=401)
     
-    try:
-        session = UserSession.objects.get(
-            user=request.user,
-            session_key=request.session.session_key,
-            is_active=True
-        )
-        return JsonResponse({
-            'valid': True,
-            'user': request.user.username,
-            'last_activity': session.last_activity.isoformat()
-        })
-    except UserSession.DoesNotExist:
-        return JsonResponse({'valid': False}, status=401)
+    return FastJsonResponse({
+        'valid': True,
+        'user': request.user.username,
+        'last_activity': data['last_activity'].isoformat()
+    })
+
+
+def session_cache_key(session_key):
+    """Return the cache key holding an active session's summary."""
+    return f"session:active:{session_key}"
 
 
 def get_client_ip(request):
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-15 23:05
+
+from django.db import migrations, models
+
+import devops_pipeline.apps.catalog.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("catalog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="product",
+            name="sku",
+            field=models.CharField(
+                max_length=50,
+                unique=True,
+                validators=[devops_pipeline.apps.catalog.validators.validate_sku],
+            ),
+        ),
+    ]
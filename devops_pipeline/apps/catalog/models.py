@@ -2,11 +2,13 @@
 
 from django.db import models
 
+from .validators import SKU_MAX_LENGTH, validate_sku
+
 
 class Product(models.Model):
     """Product model for the catalog."""
 
-    sku = models.CharField(max_length=50, unique=True)
+    sku = models.CharField(max_length=SKU_MAX_LENGTH, unique=True, validators=[validate_sku])
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -1,7 +1,55 @@
 """Catalog services."""
 
+from django.core.cache import cache
+
 from .models import Product
 
+ACTIVE_PRODUCTS_CACHE_KEY = "catalog:active_products"
+ACTIVE_PRODUCTS_CACHE_TTL = 60  # seconds
+PRODUCT_CACHE_TTL = 300  # seconds
+
+
+def product_cache_key(sku):
+    """Return the cache key for a single product looked up by SKU."""
+    return f"product:sku:{sku}"
+
+
+def get_active_products():
+    """Return active products ordered by name, served from cache when possible."""
+    return cache.get_or_set(
+        ACTIVE_PRODUCTS_CACHE_KEY,
+        lambda: list(
+            Product.objects.filter(is_active=True)
+            .only("sku", "name", "description", "price", "stock")
+            .order_by("name")
+        ),
+        ACTIVE_PRODUCTS_CACHE_TTL,
+    )
+
+
+def invalidate_active_products():
+    """Drop the cached active product list."""
+    cache.delete(ACTIVE_PRODUCTS_CACHE_KEY)
+
+
+def get_active_product(sku):
+    """Return ``{"id": ..., "price": ...}`` for an active product, cached by SKU.
+
+    Raises ``Product.DoesNotExist`` if no active product has this SKU.
+    """
+    key = product_cache_key(sku)
+    data = cache.get(key)
+    if data is None:
+        product = Product.objects.only("id", "price").get(sku=sku, is_active=True)
+        data = {"id": product.pk, "price": product.price}
+        cache.set(key, data, PRODUCT_CACHE_TTL)
+    return data
+
+
+def invalidate_product(sku):
+    """Drop the cached lookup for a single product."""
+    cache.delete(product_cache_key(sku))
+
 
 def create_discounted_product(price, discount, final_price=None):
     """Create a discounted product for testing."""
@@ -0,0 +1,15 @@
+"""Catalog signal handlers."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Product
+from .services import invalidate_active_products, invalidate_product
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def product_changed(sender, instance, **kwargs):
+    """Invalidate cached product data whenever a product changes."""
+    invalidate_active_products()
+    invalidate_product(instance.sku)
@@ -0,0 +1,18 @@
+"""Catalog validators."""
+
+import re
+
+from django.core.exceptions import ValidationError
+
+SKU_MAX_LENGTH = 50
+
+# Letters and digits, optionally separated by ".", "_" or "-"
+SKU_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def validate_sku(sku):
+    """Raise ``ValidationError`` unless ``sku`` is a well-formed product SKU."""
+    if not isinstance(sku, str) or not 0 < len(sku) <= SKU_MAX_LENGTH:
+        raise ValidationError("Invalid SKU", code="invalid_sku")
+    if not SKU_PATTERN.fullmatch(sku):
+        raise ValidationError("Invalid SKU", code="invalid_sku")
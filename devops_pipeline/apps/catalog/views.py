@@ -2,10 +2,10 @@
 
 from django.shortcuts import render
 
-from .models import Product
+from .services import get_active_products
 
 
 def product_list(request):
     """Display list of active products."""
-    products = Product.objects.filter(is_active=True).order_by("name")
+    products = get_active_products()
     return render(request, "catalog/product_list.html", {"products": products})
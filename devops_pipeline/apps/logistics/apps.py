@@ -5,4 +5,7 @@ from django.apps import AppConfig
 
 class LogisticsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "devops_pipeline.apps.logistics" 
\ No newline at end of file
+    name = "devops_pipeline.apps.logistics"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,184 @@
+# Generated by Django 5.0.14 on 2026-10-15 10:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("catalog", "0001_initial"),
+        ("orders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Warehouse",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("address", models.TextField()),
+                ("code", models.CharField(max_length=10, unique=True)),
+                ("capacity", models.PositiveIntegerField()),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="Shipping",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("tracking_number", models.CharField(max_length=50, unique=True)),
+                (
+                    "carrier",
+                    models.CharField(
+                        choices=[
+                            ("dhl", "DHL"),
+                            ("ups", "UPS"),
+                            ("fedex", "FedEx"),
+                            ("hermes", "Hermes"),
+                            ("dpd", "DPD"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("picked", "Picked"),
+                            ("packed", "Packed"),
+                            ("shipped", "Shipped"),
+                            ("in_transit", "In Transit"),
+                            ("delivered", "Delivered"),
+                            ("returned", "Returned"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("shipping_address", models.TextField()),
+                ("estimated_delivery", models.DateTimeField(blank=True, null=True)),
+                ("actual_delivery", models.DateTimeField(blank=True, null=True)),
+                (
+                    "weight",
+                    models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True),
+                ),
+                ("dimensions", models.CharField(blank=True, max_length=50)),
+                ("shipping_cost", models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shipping",
+                        to="orders.order",
+                    ),
+                ),
+                (
+                    "warehouse",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="logistics.warehouse"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ShippingEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("picked", "Picked"),
+                            ("packed", "Packed"),
+                            ("shipped", "Shipped"),
+                            ("in_transit", "In Transit"),
+                            ("delivered", "Delivered"),
+                            ("returned", "Returned"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("location", models.CharField(blank=True, max_length=100)),
+                ("description", models.TextField()),
+                ("event_time", models.DateTimeField(auto_now_add=True)),
+                (
+                    "shipping",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="logistics.shipping",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-event_time"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Inventory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                ("reserved_quantity", models.PositiveIntegerField(default=0)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="catalog.product"
+                    ),
+                ),
+                (
+                    "warehouse",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="logistics.warehouse"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["product__name", "warehouse__name"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="shipping",
+            index=models.Index(fields=["status"], name="shipping_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="shipping",
+            index=models.Index(fields=["-created_at"], name="shipping_created_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="inventory",
+            unique_together={("product", "warehouse")},
+        ),
+    ]
@@ -54,6 +54,10 @@ class Shipping(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status"], name="shipping_status_idx"),
+            models.Index(fields=["-created_at"], name="shipping_created_idx"),
+        ]
 
     def __str__(self):
         return f"Shipping for Order #{self.order.pk} - {self.tracking_number}"
@@ -1,39 +1,85 @@
 """Logistics services."""
 
 import random
+import secrets
 import string
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
 
 from .models import Shipping, ShippingEvent, Warehouse
 
 
+DEFAULT_WAREHOUSE_CACHE_KEY = "warehouse:default"
+DEFAULT_WAREHOUSE_CACHE_TTL = 3600  # seconds
+ESTIMATED_DELIVERY_DELAY = timedelta(days=3)
+
+_ALPHANUM = string.ascii_uppercase + string.digits
+_UPS_SUFFIX_LENGTH = 16
+
+
+def _randint(low, high):
+    """Return a random integer in ``[low, high]`` from the OS CSPRNG."""
+    return low + secrets.randbelow(high - low + 1)
+
+
+def _ups_suffix():
+    """Return 16 random alphanumerics from a single random draw."""
+    n = secrets.randbelow(len(_ALPHANUM) ** _UPS_SUFFIX_LENGTH)
+    chars = []
+    for _ in range(_UPS_SUFFIX_LENGTH):
+        n, index = divmod(n, len(_ALPHANUM))
+        chars.append(_ALPHANUM[index])
+    return "".join(chars)
+
+
+_TRACKING_GENERATORS = {
+    "dhl": lambda: f"DHL{_randint(10000000, 99999999)}",
+    "ups": lambda: f"1Z{_ups_suffix()}",
+    "fedex": lambda: f"{_randint(1000, 9999)} {_randint(1000, 9999)} {_randint(1000, 9999)}",
+    "hermes": lambda: f"H{_randint(100000000000, 999999999999)}",
+    "dpd": lambda: f"{_randint(10000000000000, 99999999999999)}",
+}
+
+
 def generate_tracking_number(carrier):
     """Generate a realistic tracking number for the carrier."""
-    if carrier == "dhl":
-        return f"DHL{random.randint(10000000, 99999999)}"
-    elif carrier == "ups":
-        return f"1Z{''.join(random.choices(string.ascii_uppercase + string.digits, k=16))}"
-    elif carrier == "fedex":
-        return f"{random.randint(1000, 9999)} {random.randint(1000, 9999)} {random.randint(1000, 9999)}"
-    elif carrier == "hermes":
-        return f"H{random.randint(100000000000, 999999999999)}"
-    elif carrier == "dpd":
-        return f"{random.randint(10000000000000, 99999999999999)}"
-    else:
-        return f"TRACK{random.randint(100000000, 999999999)}"
+    generator = _TRACKING_GENERATORS.get(carrier)
+    if generator is None:
+        return f"TRACK{_randint(100000000, 999999999)}"
+    return generator()
+
+
+def get_default_warehouse():
+    """Return ``(id, address)`` of the warehouse used for new shipments.
+
+    The lookup is cached; a main warehouse is created if none is active.
+    """
+    warehouse = cache.get(DEFAULT_WAREHOUSE_CACHE_KEY)
+    if warehouse is None:
+        # Find an active warehouse (simplified logic)
+        instance = Warehouse.objects.filter(is_active=True).only("id", "address").first()
+        if not instance:
+            instance = Warehouse.objects.create(
+                name="Main Warehouse",
+                code="MAIN",
+                address="Hauptlager Str. 1, 70173 Stuttgart",
+                capacity=10000
+            )
+        warehouse = (instance.pk, instance.address)
+        cache.set(DEFAULT_WAREHOUSE_CACHE_KEY, warehouse, DEFAULT_WAREHOUSE_CACHE_TTL)
+    return warehouse
+
+
+def invalidate_default_warehouse():
+    """Drop the cached default warehouse."""
+    cache.delete(DEFAULT_WAREHOUSE_CACHE_KEY)
 
 
 def create_shipment(order, shipping_address, carrier="dhl"):
     """Create a shipment for an order."""
-    # Find an active warehouse (simplified logic)
-    warehouse = Warehouse.objects.filter(is_active=True).first()
-    if not warehouse:
-        warehouse = Warehouse.objects.create(
-            name="Main Warehouse",
-            code="MAIN",
-            address="Hauptlager Str. 1, 70173 Stuttgart",
-            capacity=10000
-        )
+    warehouse_id, warehouse_address = get_default_warehouse()
     
     # Generate tracking number
     tracking_number = generate_tracking_number(carrier)
@@ -41,11 +87,11 @@ def create_shipment(order, shipping_address, carrier="dhl"):
     # Create shipping record
     shipping = Shipping.objects.create(
         order=order,
-        warehouse=warehouse,
+        warehouse_id=warehouse_id,
         tracking_number=tracking_number,
         carrier=carrier,
         shipping_address=shipping_address,
-        estimated_delivery=datetime.now() + timedelta(days=3),
+        estimated_delivery=timezone.now() + ESTIMATED_DELIVERY_DELAY,
         weight=0.5,  # Default weight
         dimensions="20 x 15 x 10 cm"
     )
@@ -54,7 +100,7 @@ def create_shipment(order, shipping_address, carrier="dhl"):
     ShippingEvent.objects.create(
         shipping=shipping,
         status=Shipping.Status.PENDING,
-        location=warehouse.address,
+        location=warehouse_address,
         description="Order received at warehouse"
     )
     
@@ -64,7 +110,15 @@ def create_shipment(order, shipping_address, carrier="dhl"):
 def update_shipping_status(shipping, new_status, location="", description=""):
     """Update shipping status with event tracking."""
     shipping.status = new_status
-    shipping.save()
+    update_fields = ["status", "updated_at"]
+    
+    # Update order status if delivered
+    if new_status == Shipping.Status.DELIVERED:
+        shipping.order.status = "delivered"
+        shipping.order.save(update_fields=["status", "updated_at"])
+        shipping.actual_delivery = timezone.now()
+        update_fields.append("actual_delivery")
+    shipping.save(update_fields=update_fields)
     
     # Create shipping event
     ShippingEvent.objects.create(
@@ -73,13 +127,6 @@ def update_shipping_status(shipping, new_status, location="", description=""):
         location=location,
         description=description or f"Status updated to {shipping.get_status_display()}"
     )
-    
-    # Update order status if delivered
-    if new_status == Shipping.Status.DELIVERED:
-        shipping.order.status = "delivered"
-        shipping.order.save()
-        shipping.actual_delivery = datetime.now()
-        shipping.save()
 
 
 def simulate_shipping_progress(shipping):
@@ -92,12 +139,33 @@ def simulate_shipping_progress(shipping):
         (Shipping.Status.DELIVERED, "Package delivered successfully")
     ]
     
-    for status, description in statuses:
-        if shipping.status != status:
-            update_shipping_status(
-                shipping, 
-                status, 
-                location=f"Transit Hub {random.randint(1, 5)}", 
-                description=description
-            )
-            break 
\ No newline at end of file
+    steps = [status for status, _ in statuses]
+    if shipping.status == Shipping.Status.PENDING:
+        remaining = statuses
+    elif shipping.status in steps:
+        remaining = statuses[steps.index(shipping.status) + 1:]
+    else:
+        remaining = []
+
+    if not remaining:
+        return
+
+    # One INSERT for all remaining events, one UPDATE for the shipment
+    ShippingEvent.objects.bulk_create([
+        ShippingEvent(
+            shipping=shipping,
+            status=status,
+            location=f"Transit Hub {random.randint(1, 5)}",
+            description=description
+        )
+        for status, description in remaining
+    ])
+
+    shipping.status = remaining[-1][0]
+    update_fields = ["status", "updated_at"]
+    if shipping.status == Shipping.Status.DELIVERED:
+        shipping.order.status = "delivered"
+        shipping.order.save(update_fields=["status", "updated_at"])
+        shipping.actual_delivery = timezone.now()
+        update_fields.append("actual_delivery")
+    shipping.save(update_fields=update_fields)
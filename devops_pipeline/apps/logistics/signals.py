@@ -0,0 +1,14 @@
+"""Logistics signal handlers."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Warehouse
+from .services import invalidate_default_warehouse
+
+
+@receiver(post_save, sender=Warehouse)
+@receiver(post_delete, sender=Warehouse)
+def warehouse_changed(sender, **kwargs):
+    """Invalidate the cached default warehouse whenever a warehouse changes."""
+    invalidate_default_warehouse()
@@ -1,24 +1,38 @@
 """Logistics views."""
 
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.views.decorators.http import require_http_methods
 
+from devops_pipeline.http import FastJsonResponse
+
 from .models import Shipping, ShippingEvent
 
+STATUS_DISPLAY = dict(Shipping.Status.choices)
+
 
 @login_required
 def track_shipment(request, tracking_number):
     """Track shipment by tracking number."""
     try:
-        shipping = Shipping.objects.get(tracking_number=tracking_number)
+        shipping = Shipping.objects.select_related("order", "order__user").get(
+            tracking_number=tracking_number
+        )
         
         # Check if user owns this order
         if shipping.order.user != request.user:
-            return JsonResponse({'error': 'Unauthorized'}, status=403)
+            return FastJsonResponse({'error': 'Unauthorized'}, status=403)
         
-        events = shipping.events.all()
+        # Plain dicts: no model instances needed just to read four columns
+        events = [
+            {
+                'status': STATUS_DISPLAY[event['status']],
+                'location': event['location'],
+                'description': event['description'],
+                'timestamp': event['event_time'].isoformat()
+            }
+            for event in shipping.events.values('status', 'location', 'description', 'event_time')
+        ]
         
         tracking_data = {
             'tracking_number': shipping.tracking_number,
@@ -26,19 +40,11 @@ def track_shipment(request, tracking_number):
             'status': shipping.get_status_display(),
             'estimated_delivery': shipping.estimated_delivery,
             'actual_delivery': shipping.actual_delivery,
-            'events': [
-                {
-                    'status': event.get_status_display(),
-                    'location': event.location,
-                    'description': event.description,
-                    'timestamp': event.event_time.isoformat()
-                }
-                for event in events
-            ]
+            'events': events
         }
         
         if request.headers.get('Accept') == 'application/json':
-            return JsonResponse(tracking_data)
+            return FastJsonResponse(tracking_data)
         
         return render(request, 'logistics/tracking.html', {
             'shipping': shipping,
@@ -47,7 +53,7 @@ def track_shipment(request, tracking_number):
         
     except Shipping.DoesNotExist:
         if request.headers.get('Accept') == 'application/json':
-            return JsonResponse({'error': 'Tracking number not found'}, status=404)
+            return FastJsonResponse({'error': 'Tracking number not found'}, status=404)
         return render(request, 'logistics/tracking_not_found.html')
 
 
@@ -55,16 +61,16 @@ def track_shipment(request, tracking_number):
 def shipping_status(request, order_id):
     """Get shipping status for an order."""
     if not request.user.is_authenticated:
-        return JsonResponse({'error': 'Authentication required'}, status=401)
+        return FastJsonResponse({'error': 'Authentication required'}, status=401)
     
     try:
         shipping = Shipping.objects.get(order_id=order_id)
         
         # Check if user owns this order
         if shipping.order.user != request.user:
-            return JsonResponse({'error': 'Unauthorized'}, status=403)
+            return FastJsonResponse({'error': 'Unauthorized'}, status=403)
         
-        return JsonResponse({
+        return FastJsonResponse({
             'order_id': order_id,
             'tracking_number': shipping.tracking_number,
             'carrier': shipping.get_carrier_display(),
@@ -74,14 +80,17 @@ def shipping_status(request, order_id):
         })
         
     except Shipping.DoesNotExist:
-        return JsonResponse({'error': 'Shipping information not found'}, status=404)
+        return FastJsonResponse({'error': 'Shipping information not found'}, status=404)
 
 
 @login_required
 def shipping_history(request):
     """Show user's shipping history."""
-    user_orders = request.user.order_set.all()
-    shipments = Shipping.objects.filter(order__in=user_orders).order_by('-created_at')
+    shipments = (
+        Shipping.objects.filter(order__user=request.user)
+        .select_related("order", "warehouse")
+        .order_by("-created_at")
+    )
     
     return render(request, 'logistics/shipping_history.html', {
         'shipments': shipments
@@ -4,6 +4,7 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.db import models
+from django.db.models import DecimalField, F, Sum
 
 from devops_pipeline.apps.catalog.models import Product
 
@@ -32,7 +33,12 @@ class Order(models.Model):
 
     def calculate_total(self):
         """Calculate order total from items."""
-        total = sum(item.quantity * item.price for item in self.items.all())
+        total = self.items.aggregate(
+            total=Sum(
+                F("quantity") * F("price"),
+                output_field=DecimalField(max_digits=10, decimal_places=2),
+            )
+        )["total"] or Decimal("0.00")
         self.total = total
         return total
 
@@ -1,18 +1,94 @@
 """Orders views."""
 
 import json
+import re
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.cache import cache
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404, redirect, render
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.shortcuts import redirect, render
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
 from devops_pipeline.apps.catalog.models import Product
+from devops_pipeline.apps.catalog.services import get_active_product, invalidate_active_products
+from devops_pipeline.apps.catalog.validators import validate_sku
+from devops_pipeline.http import FastJsonResponse
 
 from .models import Order, OrderItem
 
+# Order payloads are a flat {"sku": ..., "qty": ...} object; allow a little headroom
+MAX_BODY_DEPTH = 3
+
+# Bytes that open or close a nesting level or a string literal
+JSON_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+
+
+def _is_valid_qty(qty):
+    """Return whether ``qty`` is a whole number between 1 and ``ORDER_MAX_QTY``."""
+    # bool is an int subclass, so JSON true/false must be ruled out explicitly
+    return isinstance(qty, int) and not isinstance(qty, bool) and 1 <= qty <= settings.ORDER_MAX_QTY
+
+
+def _string_end(body, start):
+    """Return the index just past the JSON string literal opening at ``start``.
+
+    Unterminated strings run to the end of ``body``.
+    """
+    index = start
+    while True:
+        index = body.find(b'"', index + 1)
+        if index == -1:
+            return len(body)
+        # The quote closes the string unless an odd run of backslashes escapes it
+        run_start = index
+        while body[run_start - 1] == 0x5C:
+            run_start -= 1
+        if (index - run_start) % 2 == 0:
+            return index + 1
+
+
+def _exceeds_depth(body, limit):
+    """Return whether the JSON ``body`` nests objects or arrays deeper than ``limit``.
+
+    A single forward pass counts brackets, skipping string literals, so an
+    over-nested payload is refused before ``json.loads`` builds any of it.
+    """
+    depth = 0
+    match = JSON_STRUCTURAL.search(body)
+    while match:
+        if match.group() == b'"':
+            position = _string_end(body, match.start())
+        else:
+            depth += 1 if match.group() in b"{[" else -1
+            if depth > limit:
+                return True
+            position = match.end()
+        match = JSON_STRUCTURAL.search(body, position)
+    return False
+
+
+def _reserve_stock(sku, qty):
+    """Atomically decrement stock for an active product.
+
+    Returns the cached ``{"id", "price"}`` lookup for the product. Must run
+    inside a transaction so the decrement is rolled back if the order
+    cannot be created. Raises ``Product.DoesNotExist`` when the SKU
+    is unknown, inactive or has insufficient stock.
+    """
+    updated = Product.objects.filter(sku=sku, is_active=True, stock__gte=qty).update(
+        stock=F("stock") - qty
+    )
+    if not updated:
+        raise Product.DoesNotExist
+    # update() bypasses post_save, so drop the cached catalog (and its stock
+    # counts) ourselves once the decrement is committed
+    transaction.on_commit(invalidate_active_products)
+    return get_active_product(sku)
+
 
 @csrf_exempt
 @login_required
@@ -20,33 +96,46 @@ from .models import Order, OrderItem
 def create_order(request):
     """Create a new order."""
     try:
+        if _exceeds_depth(request.body, MAX_BODY_DEPTH):
+            return FastJsonResponse({"error": "Invalid JSON structure"}, status=400)
         data = json.loads(request.body)
+        if not isinstance(data, dict):
+            return FastJsonResponse({"error": "Invalid JSON structure"}, status=400)
         sku = data.get("sku")
         qty = data.get("qty", 1)
-
-        product = Product.objects.get(sku=sku, is_active=True)
-
-        # Create order
-        order = Order.objects.create(
-            user=request.user, status=Order.Status.PAID  # Simplified for demo
-        )
-
-        # Create order item
-        OrderItem.objects.create(order=order, product=product, quantity=qty, price=product.price)
-
-        # Calculate total
-        order.total = product.price * qty
-        order.save()
+        # Reject bad input before touching the database
+        if not _is_valid_qty(qty):
+            return FastJsonResponse({"error": "Invalid quantity"}, status=400)
+        try:
+            validate_sku(sku)
+        except ValidationError:
+            # A malformed SKU can never match a product
+            return FastJsonResponse({"error": "Product not found"}, status=404)
+
+        with transaction.atomic():
+            product = _reserve_stock(sku, qty)
+
+            # Create order with its final total, no follow-up UPDATE needed
+            order = Order.objects.create(
+                user=request.user,
+                status=Order.Status.PAID,  # Simplified for demo
+                total=product["price"] * qty,
+            )
+
+            # Create order item
+            OrderItem.objects.create(
+                order=order, product_id=product["id"], quantity=qty, price=product["price"]
+            )
 
         # Cache the price
         cache.set(f"order:{order.pk}:total", str(order.total), 3600)
 
-        return JsonResponse({"id": order.pk, "total": str(order.total)}, status=201)
+        return FastJsonResponse({"id": order.pk, "total": str(order.total)}, status=201)
 
     except Product.DoesNotExist:
-        return JsonResponse({"error": "Product not found"}, status=404)
+        return FastJsonResponse({"error": "Product not found"}, status=404)
     except Exception as e:
-        return JsonResponse({"error": str(e)}, status=400)
+        return FastJsonResponse({"error": str(e)}, status=400)
 
 
 @login_required
@@ -58,27 +147,31 @@ def create_order_web(request):
     try:
         sku = request.POST.get("sku")
         qty = int(request.POST.get("qty", 1))
+        if not _is_valid_qty(qty):
+            return redirect("catalog:product_list")
+        validate_sku(sku)
 
-        product = get_object_or_404(Product, sku=sku, is_active=True)
-
-        # Create order
-        order = Order.objects.create(
-            user=request.user, status=Order.Status.PAID  # Simplified for demo
-        )
+        with transaction.atomic():
+            product = _reserve_stock(sku, qty)
 
-        # Create order item
-        OrderItem.objects.create(order=order, product=product, quantity=qty, price=product.price)
+            # Create order with its final total, no follow-up UPDATE needed
+            order = Order.objects.create(
+                user=request.user,
+                status=Order.Status.PAID,  # Simplified for demo
+                total=product["price"] * qty,
+            )
 
-        # Calculate total
-        order.total = product.price * qty
-        order.save()
+            # Create order item
+            OrderItem.objects.create(
+                order=order, product_id=product["id"], quantity=qty, price=product["price"]
+            )
 
         # Cache the price
         cache.set(f"order:{order.pk}:total", str(order.total), 3600)
 
         return render(request, "orders/success.html", {"order": order})
 
-    except Product.DoesNotExist:
+    except (Product.DoesNotExist, ValidationError):
         return redirect("catalog:product_list")
     except Exception:
         return redirect("catalog:product_list")
@@ -87,5 +180,10 @@ def create_order_web(request):
 @login_required
 def order_list(request):
     """Display user's orders."""
-    orders = Order.objects.filter(user=request.user).order_by("-created_at")
+    orders = (
+        Order.objects.filter(user=request.user)
+        .only("id", "status", "total", "created_at")
+        .prefetch_related("items__product")
+        .order_by("-created_at")
+    )
     return render(request, "orders/order_list.html", {"orders": orders})
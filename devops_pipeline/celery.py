@@ -0,0 +1,11 @@
+"""Celery application for the DevOps Pipeline project."""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "devops_pipeline.settings.base")
+
+app = Celery("devops_pipeline")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
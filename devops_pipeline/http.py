@@ -0,0 +1,28 @@
+"""Shared HTTP helpers."""
+
+import orjson
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+_fallback_default = DjangoJSONEncoder().default
+
+
+class FastJsonResponse(HttpResponse):
+    """Drop-in ``JsonResponse`` that serializes with orjson.
+
+    Datetimes are encoded natively; types orjson does not know (Decimal,
+    lazy strings, ...) fall back to ``DjangoJSONEncoder``.
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                "In order to allow non-dict objects to be serialized set the "
+                "safe parameter to False."
+            )
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(
+            content=orjson.dumps(data, default=_fallback_default, option=_ORJSON_OPTIONS),
+            **kwargs,
+        )
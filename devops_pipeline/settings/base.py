@@ -103,6 +103,10 @@ CACHES = {
     }
 }
 
+# Sessions: read through the cache, fall back to the database on a miss
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_CACHE_ALIAS = "default"
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -145,6 +149,9 @@ LOGOUT_REDIRECT_URL = "/"
 
 # Using default Django user model
 
+# Orders: largest quantity accepted on a single order line
+ORDER_MAX_QTY = int(os.getenv("ORDER_MAX_QTY", "10000"))
+
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
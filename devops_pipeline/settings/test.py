@@ -38,21 +38,13 @@ CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 
-# Cache settings for tests
-if is_integration_test:
-    CACHES = {
-        "default": {
-            "BACKEND": "django.core.cache.backends.redis.RedisCache",
-            "LOCATION": REDIS_URL,
-        }
-    }
-else:
-    CACHES = {
-        "default": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-            "LOCATION": "unique-snowflake",
-        }
+# Cache settings for tests - in-process, so cache hits cost no network round-trip
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "unique-snowflake",
     }
+}
 
 
 # Disable migrations for faster tests
@@ -66,9 +58,9 @@ class DisableMigrations:
 
 MIGRATION_MODULES = DisableMigrations()
 
-# Password hashing
+# Password hashing (no-op hasher, tests never need real hashes)
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.MD5PasswordHasher",
+    "tests.hashers.PlainTextPasswordHasher",
 ]
 
 # Email backend for tests
@@ -118,5 +110,5 @@ CELERY_TASK_EAGER_PROPAGATES = True
 
 # Security settings for tests
 SECRET_KEY = "test-secret-key-not-for-production"
-DEBUG = True
+DEBUG = False
 ALLOWED_HOSTS = ["*"]
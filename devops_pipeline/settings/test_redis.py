@@ -0,0 +1,17 @@
+"""Test settings backed by the Redis test cache.
+
+The default test settings use LocMemCache, so the Redis-only load checks
+skip there. Run them against the ``redis_test`` service from
+docker-compose.test.yml with::
+
+    pytest --ds=devops_pipeline.settings.test_redis tests/load
+"""
+
+from .test import *  # noqa
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,  # noqa: F405
+    }
+}
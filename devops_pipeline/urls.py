@@ -6,18 +6,19 @@ from django.contrib import admin
 from django.urls import include, path
 
 urlpatterns = [
-    # Admin
-    path("admin/", admin.site.urls),
-    # Web interface for E2E testing
+    # Most requested routes first; the resolver tries patterns in order.
+    # orders/ must stay ahead of api/v1/orders/ (and logistics/ ahead of
+    # api/v1/logistics/) so reverse() keeps returning the web URLs.
     path("", include("devops_pipeline.apps.catalog.urls")),
     path("orders/", include("devops_pipeline.apps.orders.urls")),
-    path("logistics/", include("devops_pipeline.apps.logistics.urls")),
+    path("api/v1/orders/", include("devops_pipeline.apps.orders.urls")),
     path("auth/", include("devops_pipeline.apps.auth.urls")),
+    path("logistics/", include("devops_pipeline.apps.logistics.urls")),
+    path("api/v1/logistics/", include("devops_pipeline.apps.logistics.urls")),
     path("accounts/", include(("django.contrib.auth.urls", "accounts"), namespace="accounts")),
-    # API endpoints
     path("api/v1/auth/", include("rest_framework.urls")),
-    path("api/v1/orders/", include("devops_pipeline.apps.orders.urls")),
-    path("api/v1/logistics/", include("devops_pipeline.apps.logistics.urls")),
+    # Admin
+    path("admin/", admin.site.urls),
 ]
 
 # Serve media files in development
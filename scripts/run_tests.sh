@@ -238,7 +238,7 @@ run_e2e_tests() {
         
         # Check for ChromeDriver
         if ! command -v chromedriver &> /dev/null; then
-            log_warning "ChromeDriver not found. Installing via webdriver-manager..."
+            log_warning "ChromeDriver not found. Selenium Manager will resolve one."
         fi
         
         # Start test services
@@ -253,6 +253,8 @@ run_e2e_tests() {
         if uv run pytest tests/e2e/ \
             -v \
             --tb=short \
+            -n auto \
+            --dist=loadfile \
             --junit-xml=e2e-test-results.xml \
             -m e2e; then
             
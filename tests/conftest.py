@@ -0,0 +1,13 @@
+"""Test configuration and fixtures shared by every suite."""
+
+from django.core.cache import cache
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start and finish every test with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
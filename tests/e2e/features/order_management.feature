@@ -27,7 +27,7 @@ Feature: Order Management
 
   Scenario: User can view order history
     Given the user is logged in as "testuser"
-    And the user has placed an order for product "TEST-001" with quantity 1
+    And the user has an existing order for product "TEST-001" with quantity 1
     When the user navigates to "View My Orders"
     Then the user should see their order history
     And the order should show "1x Test Product - $29.99 each"
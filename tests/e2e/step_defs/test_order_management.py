@@ -1,14 +1,18 @@
 """Step definitions for order management E2E tests."""
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.test import Client
 
 import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from devops_pipeline.apps.catalog.models import Product
+from devops_pipeline.apps.orders.models import Order, OrderItem
 
 User = get_user_model()
 
@@ -18,6 +22,74 @@ scenarios("../features/order_management.feature")
 # Mark all scenarios in this file as E2E tests
 pytestmark = pytest.mark.e2e
 
+# Locators, kept as CSS/ID lookups instead of XPath text searches
+PAGE_HEADER = (By.TAG_NAME, "h1")
+PAGE_BODY = (By.CSS_SELECTOR, "body")
+WELCOME = (By.CSS_SELECTOR, '[data-testid="welcome"]')
+AVAILABLE_PRODUCTS = (By.CSS_SELECTOR, '[data-testid="available-products"]')
+ORDER_SUCCESS = (By.CSS_SELECTOR, '[data-testid="order-success"]')
+ORDER_TOTAL = (By.CSS_SELECTOR, '[data-testid="order-total"]')
+ORDER_STATUS = (By.CSS_SELECTOR, '[data-testid="order-status"]')
+ORDER_LIST = (By.CSS_SELECTOR, ".order-list")
+ORDER_FORM = (By.CLASS_NAME, "order-form")
+USERNAME_FIELD = (By.NAME, "username")
+PASSWORD_FIELD = (By.NAME, "password")
+SUBMIT_BUTTON = (By.CSS_SELECTOR, 'button[type="submit"]')
+QTY_SELECT = (By.NAME, "qty")
+ORDER_BUTTON = (By.NAME, "add_to_order")
+
+
+# Explicit waits poll every 50ms rather than WebDriverWait's default 500ms
+WAIT_TIMEOUT = 5
+WAIT_POLL_FREQUENCY = 0.05
+
+
+def wait_for(browser, timeout=WAIT_TIMEOUT):
+    """Return an explicit wait that polls quickly."""
+    return WebDriverWait(browser, timeout, poll_frequency=WAIT_POLL_FREQUENCY)
+
+
+# Checks every (selector, text) pair in a single WebDriver round-trip
+TEXTS_PRESENT_JS = """
+return arguments[0].map(([selector, text]) => {
+    const element = document.querySelector(selector);
+    return element !== null && element.innerText.includes(text);
+});
+"""
+
+
+def assert_texts(browser, *checks):
+    """Wait until each (locator, text) pair matches, polling with one script call."""
+    pairs = [[locator[1], text] for locator, text in checks]
+    wait = wait_for(browser)
+    try:
+        wait.until(lambda driver: all(driver.execute_script(TEXTS_PRESENT_JS, pairs)))
+    except TimeoutException:
+        found = browser.execute_script(TEXTS_PRESENT_JS, pairs)
+        missing = [text for (_, text), ok in zip(pairs, found) if not ok]
+        raise AssertionError(f"Text not found on page: {missing}") from None
+
+
+class CatalogPage:
+    """Page object for the product catalog."""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    def product(self, sku):
+        """Return the list item for the given SKU."""
+        return self.browser.find_element(By.CSS_SELECTOR, f'[data-sku="{sku}"]')
+
+    def select_quantity(self, sku, quantity):
+        """Pick a quantity for the given SKU and return its list item."""
+        product_item = self.product(sku)
+        Select(product_item.find_element(*QTY_SELECT)).select_by_value(str(quantity))
+        return product_item
+
+    def order(self, sku, quantity):
+        """Select a quantity and submit the order form for the given SKU."""
+        self.select_quantity(sku, quantity).find_element(*ORDER_BUTTON).click()
+
 
 @given("the application is running")
 def application_running(live_server):
@@ -52,8 +124,8 @@ def create_test_product(db, sku, name, price, stock):
 def navigate_to_catalog(browser, live_server):
     """Navigate to the product catalog page."""
     browser.get(live_server.url)
-    wait = WebDriverWait(browser, 10)
-    wait.until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+    wait = wait_for(browser)
+    wait.until(EC.presence_of_element_located(PAGE_HEADER))
 
 
 @given("the user is not logged in")
@@ -61,61 +133,59 @@ def ensure_logged_out(browser):
     """Ensure user is not logged in."""
     # Check if logout link exists and click it
     try:
-        logout_link = browser.find_element(By.LINK_TEXT, "Logout")
+        logout_link = wait_for(browser, timeout=0.5).until(
+            EC.presence_of_element_located((By.LINK_TEXT, "Logout"))
+        )
         logout_link.click()
     except Exception:
         pass  # User is already logged out
 
 
-@given(parsers.parse('the user is logged in as "{username}"'))
-def login_user(browser, live_server, username):
-    """Log in the user."""
-    browser.get(live_server.url)
+@given(parsers.parse('the user is logged in as "{username}"'), target_fixture="current_user")
+def login_user(db, browser, live_server, username):
+    """Log in the user by handing the browser a server-side session cookie.
 
-    # Click login link
-    login_link = browser.find_element(By.LINK_TEXT, "Login")
-    login_link.click()
+    The login form itself is exercised by the order placement scenario, so
+    setup steps skip the UI round-trips.
+    """
+    user = User.objects.get(username=username)
+    client = Client()
+    client.force_login(user)
+    session_cookie = client.cookies[settings.SESSION_COOKIE_NAME]
 
-    # Fill login form
-    username_field = browser.find_element(By.NAME, "username")
-    password_field = browser.find_element(By.NAME, "password")
+    # Cookies can only be set for the domain currently loaded
+    browser.get(live_server.url)
+    browser.add_cookie(
+        {"name": settings.SESSION_COOKIE_NAME, "value": session_cookie.value, "path": "/"}
+    )
+    browser.refresh()
 
-    username_field.send_keys(username)
-    password_field.send_keys("testpassword123")
+    wait = wait_for(browser)
+    wait.until(EC.text_to_be_present_in_element(WELCOME, f"Welcome, {username}!"))
+    return user
 
-    # Submit form
-    login_button = browser.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-    login_button.click()
 
-    # Wait for redirect
-    wait = WebDriverWait(browser, 10)
-    wait.until(
-        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), 'Welcome, {username}!')]"))
+@given(
+    parsers.parse('the user has an existing order for product "{sku}" with quantity {quantity:d}')
+)
+def create_existing_order(db, current_user, sku, quantity):
+    """Create a paid order directly in the database."""
+    product = Product.objects.get(sku=sku)
+    order = Order.objects.create(
+        user=current_user, status=Order.Status.PAID, total=product.price * quantity
     )
+    OrderItem.objects.create(order=order, product=product, quantity=quantity, price=product.price)
 
 
 @given(parsers.parse('the user has placed an order for product "{sku}" with quantity {quantity:d}'))
 def place_order(browser, live_server, sku, quantity):
     """Place an order for a product."""
     browser.get(live_server.url)
-
-    # Find product and select quantity
-    product_item = browser.find_element(By.CSS_SELECTOR, f'[data-sku="{sku}"]')
-    select_element = product_item.find_element(By.NAME, "qty")
-    select = Select(select_element)
-    select.select_by_value(str(quantity))
-
-    # Click order button
-    order_button = product_item.find_element(By.NAME, "add_to_order")
-    order_button.click()
+    CatalogPage(browser).order(sku, quantity)
 
     # Wait for success page
-    wait = WebDriverWait(browser, 10)
-    wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//*[contains(text(), 'Order Successfully Created!')]")
-        )
-    )
+    wait = wait_for(browser)
+    wait.until(EC.presence_of_element_located(ORDER_SUCCESS))
 
 
 @when(parsers.parse('the user logs in with username "{username}" and password "{password}"'))
@@ -126,45 +196,41 @@ def when_user_logs_in(browser, username, password):
     login_link.click()
 
     # Fill and submit login form
-    username_field = browser.find_element(By.NAME, "username")
-    password_field = browser.find_element(By.NAME, "password")
+    wait = wait_for(browser)
+    username_field = wait.until(EC.presence_of_element_located(USERNAME_FIELD))
+    password_field = browser.find_element(*PASSWORD_FIELD)
 
     username_field.send_keys(username)
     password_field.send_keys(password)
 
-    login_button = browser.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
+    login_button = browser.find_element(*SUBMIT_BUTTON)
     login_button.click()
 
 
 @when("the user is redirected to the product catalog")
 def wait_for_catalog_redirect(browser):
     """Wait for redirect to catalog page."""
-    wait = WebDriverWait(browser, 10)
-    wait.until(
-        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Available Products')]"))
-    )
+    wait = wait_for(browser)
+    wait.until(EC.presence_of_element_located(AVAILABLE_PRODUCTS))
 
 
 @when(parsers.parse('the user selects quantity "{quantity}" for product "{sku}"'))
 def select_quantity(browser, quantity, sku):
     """Select quantity for a product."""
-    product_item = browser.find_element(By.CSS_SELECTOR, f'[data-sku="{sku}"]')
-    select_element = product_item.find_element(By.NAME, "qty")
-    select = Select(select_element)
-    select.select_by_value(quantity)
+    CatalogPage(browser).select_quantity(sku, quantity)
 
 
 @when('the user clicks "Order Now"')
 def click_order_now(browser):
     """Click the Order Now button."""
-    order_button = browser.find_element(By.NAME, "add_to_order")
+    order_button = browser.find_element(*ORDER_BUTTON)
     order_button.click()
 
 
 @when(parsers.parse('the user views the product "{sku}"'))
 def view_product(browser, sku):
     """View a specific product."""
-    product_item = browser.find_element(By.CSS_SELECTOR, f'[data-sku="{sku}"]')
+    product_item = CatalogPage(browser).product(sku)
     browser.execute_script("arguments[0].scrollIntoView();", product_item)
 
 
@@ -178,12 +244,8 @@ def navigate_to_orders(browser):
 @when("the user sees the order confirmation page")
 def on_confirmation_page(browser):
     """Verify user is on order confirmation page."""
-    wait = WebDriverWait(browser, 10)
-    wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//*[contains(text(), 'Order Successfully Created!')]")
-        )
-    )
+    wait = wait_for(browser)
+    wait.until(EC.presence_of_element_located(ORDER_SUCCESS))
 
 
 @when('the user clicks "Continue Shopping"')
@@ -196,71 +258,51 @@ def click_continue_shopping(browser):
 @then("the user should see a success message")
 def verify_success_message(browser):
     """Verify success message is displayed."""
-    wait = WebDriverWait(browser, 10)
-    success_element = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "success")))
-    assert "Order Successfully Created!" in success_element.text
+    assert_texts(browser, (ORDER_SUCCESS, "Order Successfully Created!"))
 
 
 @then(parsers.parse('the order should be created with total "{total}"'))
 def verify_order_total(browser, total):
     """Verify the order total."""
-    wait = WebDriverWait(browser, 10)
-    total_element = wait.until(
-        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '${total}')]"))
-    )
-    assert total_element is not None
+    assert_texts(browser, (ORDER_TOTAL, f"${total}"))
 
 
 @then(parsers.parse('the order status should be "{status}"'))
 def verify_order_status(browser, status):
     """Verify the order status."""
-    wait = WebDriverWait(browser, 10)
-    status_element = wait.until(
-        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{status}')]"))
-    )
-    assert status_element is not None
+    assert_texts(browser, (ORDER_STATUS, status))
 
 
 @then(parsers.parse('the user should see "{text}"'))
 def verify_text_present(browser, text):
     """Verify specific text is present on the page."""
-    wait = WebDriverWait(browser, 10)
-    element = wait.until(
-        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{text}')]"))
-    )
-    assert element is not None
+    assert_texts(browser, (PAGE_BODY, text))
 
 
 @then("the user should not see an order form")
 def verify_no_order_form(browser):
     """Verify no order form is present."""
-    order_forms = browser.find_elements(By.CLASS_NAME, "order-form")
+    order_forms = browser.find_elements(*ORDER_FORM)
     assert len(order_forms) == 0
 
 
 @then("the user should see their order history")
 def verify_order_history(browser):
     """Verify order history is displayed."""
-    wait = WebDriverWait(browser, 10)
-    order_list = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "order-list")))
+    wait = wait_for(browser)
+    order_list = wait.until(EC.presence_of_element_located(ORDER_LIST))
     assert order_list is not None
 
 
 @then(parsers.parse('the order should show "{item_text}"'))
 def verify_order_item(browser, item_text):
     """Verify specific order item text."""
-    wait = WebDriverWait(browser, 10)
-    item_element = wait.until(
-        EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{item_text}')]"))
-    )
-    assert item_element is not None
+    assert_texts(browser, (ORDER_LIST, item_text))
 
 
 @then("the user should be back on the product catalog page")
 def verify_back_on_catalog(browser):
     """Verify user is back on the catalog page."""
-    wait = WebDriverWait(browser, 10)
-    catalog_header = wait.until(
-        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Available Products')]"))
-    )
+    wait = wait_for(browser)
+    catalog_header = wait.until(EC.presence_of_element_located(AVAILABLE_PRODUCTS))
     assert catalog_header is not None
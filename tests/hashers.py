@@ -0,0 +1,35 @@
+"""Password hashers for the test suite."""
+
+from django.contrib.auth.hashers import BasePasswordHasher
+from django.utils.crypto import constant_time_compare
+
+
+class PlainTextPasswordHasher(BasePasswordHasher):
+    """Store passwords verbatim so user creation and login cost nothing.
+
+    Never use outside of tests.
+    """
+
+    algorithm = "plain"
+
+    def salt(self):
+        return ""
+
+    def encode(self, password, salt):
+        return f"{self.algorithm}${salt}${password}"
+
+    def decode(self, encoded):
+        algorithm, salt, password = encoded.split("$", 2)
+        return {"algorithm": algorithm, "hash": password, "salt": salt}
+
+    def verify(self, password, encoded):
+        decoded = self.decode(encoded)
+        return decoded["algorithm"] == self.algorithm and constant_time_compare(
+            password, decoded["hash"]
+        )
+
+    def safe_summary(self, encoded):
+        return {"algorithm": self.algorithm}
+
+    def harden_runtime(self, password, encoded):
+        pass
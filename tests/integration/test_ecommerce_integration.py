@@ -1,6 +1,5 @@
 """E-commerce integration tests."""
 
-import json
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
@@ -8,6 +7,7 @@ from django.core.cache import cache
 from django.urls import reverse
 
 import pytest
+from rest_framework.test import APIClient
 
 from devops_pipeline.apps.catalog.models import Product
 from devops_pipeline.apps.orders.models import Order
@@ -15,8 +15,9 @@ from devops_pipeline.apps.orders.models import Order
 User = get_user_model()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def product(db):
+    """Create the test product inside the test's rolled-back transaction."""
     return Product.objects.create(
         sku="T-1000",
         name="Test Product",
@@ -25,24 +26,25 @@ def product(db):
     )
 
 
-@pytest.mark.integration
-@pytest.mark.django_db(transaction=True)
-def test_checkout_creates_order_and_caches_price(client, product):
-    """Test that checkout creates order and caches the price."""
-    # Create a user
+@pytest.fixture
+def authed_client(db):
+    """Return an API client logged in as a freshly created user."""
     user = User.objects.create_user(
         username="testuser", email="test@example.com", password="testpass123"
     )
+    client = APIClient()
     client.force_login(user)
+    return client
+
 
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_checkout_creates_order_and_caches_price(authed_client, product):
+    """Test that checkout creates order and caches the price."""
     url = reverse("orders:create")
     payload = {"sku": product.sku, "qty": 2}
 
-    response = client.post(
-        url,
-        data=json.dumps(payload),
-        content_type="application/json",
-    )
+    response = authed_client.post(url, payload, format="json")
 
     assert response.status_code == 201
     data = response.json()
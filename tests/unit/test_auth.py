@@ -0,0 +1,95 @@
+"""Auth unit tests."""
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from devops_pipeline.apps.auth.models import UserSession
+from devops_pipeline.apps.auth.views import session_cache_key
+
+
+@pytest.fixture
+def user(django_user_model):
+    """Create the user whose session is checked."""
+    return django_user_model.objects.create_user(username="sessionuser")
+
+
+@pytest.fixture
+def session_key(client, user):
+    """Log the client in and return its session key."""
+    client.force_login(user)
+    return client.session.session_key
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_check_session_cache_hit_skips_database(client, user, session_key):
+    """Test that a cached session summary is trusted without a UserSession row."""
+    last_activity = timezone.now()
+    cache.set(session_cache_key(session_key), {"user_id": user.id, "last_activity": last_activity})
+
+    response = client.post(reverse("auth:check_session"))
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "valid": True,
+        "user": "sessionuser",
+        "last_activity": last_activity.isoformat(),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_check_session_cache_miss_falls_back_to_database(client, user, session_key):
+    """Test that a cache miss reads the UserSession row and repopulates the cache."""
+    session = UserSession.objects.create(user=user, session_key=session_key, ip_address="127.0.0.1")
+
+    response = client.post(reverse("auth:check_session"))
+
+    assert response.status_code == 200
+    assert response.json()["valid"] is True
+    assert cache.get(session_cache_key(session_key)) == {
+        "user_id": user.id,
+        "last_activity": session.last_activity,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_check_session_cache_miss_without_session_row_is_invalid(client, session_key):
+    """Test that a session with neither a cache entry nor an active row is rejected."""
+    response = client.post(reverse("auth:check_session"))
+
+    assert response.status_code == 401
+    assert response.json() == {"valid": False}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_check_session_rejects_entry_cached_for_another_user(
+    client, user, session_key, django_user_model
+):
+    """Test that a session key cached for a different user is rejected."""
+    other = django_user_model.objects.create_user(username="otheruser")
+    cache.set(
+        session_cache_key(session_key), {"user_id": other.id, "last_activity": timezone.now()}
+    )
+
+    response = client.post(reverse("auth:check_session"))
+
+    assert response.status_code == 401
+    assert response.json() == {"valid": False}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_logout_deletes_cached_session(client, user, session_key):
+    """Test that logging out drops the session's cache entry."""
+    cache.set(session_cache_key(session_key), {"user_id": user.id, "last_activity": timezone.now()})
+
+    response = client.get(reverse("auth:logout"))
+
+    assert response.status_code == 302
+    assert cache.get(session_cache_key(session_key)) is None
@@ -2,9 +2,13 @@
 
 from decimal import Decimal
 
+from django.core.exceptions import ValidationError
+
 import pytest
 
 from devops_pipeline.apps.catalog import services
+from devops_pipeline.apps.catalog.models import Product
+from devops_pipeline.apps.catalog.validators import validate_sku
 
 
 @pytest.mark.unit
@@ -24,3 +28,71 @@ def test_create_discounted_product_calls_orm_once(mocker):
         stock=10,
     )
     assert result is fake_instance
+
+
+@pytest.mark.unit
+def test_get_active_products_queries_once_while_cached(mocker):
+    """Test that get_active_products serves repeat calls from the cache."""
+    filter_mock = mocker.patch("devops_pipeline.apps.catalog.models.Product.objects.filter")
+    filter_mock.return_value.only.return_value.order_by.return_value = ["product"]
+
+    assert services.get_active_products() == ["product"]
+    assert services.get_active_products() == ["product"]
+
+    filter_mock.assert_called_once_with(is_active=True)
+
+
+@pytest.mark.unit
+def test_get_active_products_caches_empty_catalog(mocker):
+    """Test that an empty catalog is cached rather than re-queried."""
+    filter_mock = mocker.patch("devops_pipeline.apps.catalog.models.Product.objects.filter")
+    filter_mock.return_value.only.return_value.order_by.return_value = []
+
+    assert services.get_active_products() == []
+    assert services.get_active_products() == []
+
+    filter_mock.assert_called_once_with(is_active=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("sku", ["VALID-001", "DISC-100.00-10.00", "ELE-0001", "api_7", "A" * 50])
+def test_validate_sku_accepts_catalog_skus(sku):
+    """Test that well-formed catalog SKUs pass validation."""
+    validate_sku(sku)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "sku",
+    [
+        "",  # Empty string
+        " ",  # Whitespace only
+        None,  # Null
+        42,  # Not a string
+        "A" * 51,  # Longer than the SKU column
+        "../../etc/passwd",  # Path traversal attempt
+        "<script>",  # XSS attempt
+        "'; DROP TABLE",  # SQL injection attempt
+        "VALID-001\n",  # Trailing newline
+        "SKU-émojis-🛒",
+        "SKU-中文-测试",
+        "SKU-العربية",
+        "SKU-русский",
+        "\x00\x01\x02",  # Null bytes and control characters
+    ],
+)
+def test_validate_sku_rejects_malformed_skus(sku):
+    """Test that malformed or hostile SKUs raise ValidationError."""
+    with pytest.raises(ValidationError):
+        validate_sku(sku)
+
+
+@pytest.mark.unit
+def test_product_sku_field_runs_validate_sku():
+    """Test that model validation, and so every ModelForm, rejects a malformed SKU."""
+    product = Product(sku="BAD SKU", name="Malformed SKU Product", price=Decimal("9.99"))
+
+    with pytest.raises(ValidationError) as excinfo:
+        product.clean_fields()
+
+    assert "sku" in excinfo.value.message_dict
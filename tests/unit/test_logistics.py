@@ -0,0 +1,76 @@
+"""Logistics unit tests."""
+
+import pytest
+
+from devops_pipeline.apps.logistics.models import Shipping
+from devops_pipeline.apps.logistics.services import create_shipment, simulate_shipping_progress
+from devops_pipeline.apps.orders.models import Order
+
+ALL_STEPS = [
+    Shipping.Status.PENDING,
+    Shipping.Status.PICKED,
+    Shipping.Status.PACKED,
+    Shipping.Status.SHIPPED,
+    Shipping.Status.IN_TRANSIT,
+    Shipping.Status.DELIVERED,
+]
+
+
+@pytest.fixture
+def shipping(django_user_model):
+    """Create a pending shipment for a fresh paid order."""
+    user = django_user_model.objects.create_user(username="shipper")
+    order = Order.objects.create(user=user, status=Order.Status.PAID)
+    return create_shipment(order, "Teststr. 1, 70173 Stuttgart")
+
+
+def event_statuses(shipping):
+    """Return the shipment's event statuses in the order they were recorded."""
+    # Bulk-created events can share an event_time, so order by insertion
+    return list(shipping.events.order_by("pk").values_list("status", flat=True))
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_simulate_shipping_progress_delivers_pending_shipment(shipping):
+    """Test that a pending shipment gets every step recorded in order and ends delivered."""
+    simulate_shipping_progress(shipping)
+
+    assert event_statuses(shipping) == ALL_STEPS
+    shipping.refresh_from_db()
+    assert shipping.status == Shipping.Status.DELIVERED
+    assert shipping.actual_delivery is not None
+    assert shipping.order.status == Order.Status.DELIVERED
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_simulate_shipping_progress_resumes_after_current_step(shipping):
+    """Test that only the steps after the current status are recorded."""
+    shipping.status = Shipping.Status.SHIPPED
+    shipping.save(update_fields=["status"])
+
+    simulate_shipping_progress(shipping)
+
+    assert event_statuses(shipping) == [
+        Shipping.Status.PENDING,
+        Shipping.Status.IN_TRANSIT,
+        Shipping.Status.DELIVERED,
+    ]
+    shipping.refresh_from_db()
+    assert shipping.status == Shipping.Status.DELIVERED
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_simulate_shipping_progress_leaves_delivered_shipment_alone(
+    shipping, django_assert_num_queries
+):
+    """Test that a delivered shipment records no events and issues no queries."""
+    shipping.status = Shipping.Status.DELIVERED
+    shipping.save(update_fields=["status"])
+
+    with django_assert_num_queries(0):
+        simulate_shipping_progress(shipping)
+
+    assert event_statuses(shipping) == [Shipping.Status.PENDING]
@@ -0,0 +1,31 @@
+"""Orders unit tests."""
+
+from decimal import Decimal
+
+from django.urls import reverse
+
+import pytest
+
+from devops_pipeline.apps.catalog.models import Product
+from devops_pipeline.apps.catalog.services import get_active_products
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_create_order_invalidates_cached_catalog_stock(
+    client, django_user_model, django_capture_on_commit_callbacks
+):
+    """Test that an order drops the cached product list so it shows the new stock."""
+    Product.objects.create(sku="STOCK-001", name="Stock Product", price=Decimal("5.00"), stock=5)
+    client.force_login(django_user_model.objects.create_user(username="buyer"))
+    assert get_active_products()[0].stock == 5
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            reverse("orders:create"),
+            {"sku": "STOCK-001", "qty": 2},
+            content_type="application/json",
+        )
+
+    assert response.status_code == 201
+    assert get_active_products()[0].stock == 3